@@ -10,6 +10,7 @@ Commands:
   /quit     - Exit Seagreen
 """
 
+import os
 import sys
 import time
 import math
@@ -19,11 +20,8 @@ import psutil
 from typing import Optional, List
 
 from rich.console import Console
-from rich.panel import Panel
 from rich.table import Table
 from rich.text import Text
-from rich.align import Align
-from rich.live import Live
 from rich import box
 
 from tracker import SeagreenTracker, SeagreenReport
@@ -40,6 +38,10 @@ COLORS = {
 
 console = Console()
 
+# Reused on every REPL iteration, so build them once instead of parsing markup
+_PROMPT = Text("🌊 > ", style=f"bold {COLORS['primary']}")
+_GOODBYE = Text("Goodbye! 🌊", style=f"bold {COLORS['leaf']}")
+
 
 BANNER_ART = [
     " ███████╗███████╗ █████╗  ██████╗ ██████╗ ███████╗███████╗███╗   ██╗",
@@ -51,7 +53,8 @@ BANNER_ART = [
 ]
 
 WAVE_CHARS = ["~", "≈", "~", "∽", "≈", "~", "∿", "≈"]
-LEAF_CHARS = ["🌿", "🍃", "╲", "╱", "·"]
+# Leaves must be one terminal cell wide or they shift the rest of the row
+LEAF_CHARS = ["*", "+", "╲", "╱", "·"]
 
 WAVE_WIDTH = 70
 WAVE_ROWS = 3
@@ -59,56 +62,104 @@ LEAF_FIELD_ROWS = 4
 ANIM_DURATION = 3.0
 ANIM_FPS = 8
 
+# Seconds between snapshots while tracking
+SAMPLE_INTERVAL = 0.5
+
+
+# The wave phase is 0.3 * (col + 2*tick + 4*row), so every wave line is a
+# slice of one strip sampled at integer steps of 0.3 radians.
+_WAVE_STRIP = "".join(
+    WAVE_CHARS[int((math.sin(k * 0.3) + 1) * 3.5) % len(WAVE_CHARS)]
+    for k in range(WAVE_WIDTH + 2 * int(ANIM_DURATION * ANIM_FPS) + 4 * WAVE_ROWS)
+)
+
 
 def _generate_wave_line(tick: int, row: int, width: int) -> str:
     """Generate a single animated wave line."""
-    line = []
-    for col in range(width):
-        phase = (col * 0.3) + (tick * 0.6) + (row * 1.2)
-        idx = int((math.sin(phase) + 1) * 3.5) % len(WAVE_CHARS)
-        line.append(WAVE_CHARS[idx])
-    return "".join(line)
+    start = 2 * tick + 4 * row
+    return _WAVE_STRIP[start:start + width]
+
+
+_LEAF_RNG = random.Random()
 
 
 def _generate_leaf_line(tick: int, row: int, width: int, seed: int) -> str:
     """Generate a line with sparse drifting leaves."""
-    rng = random.Random(seed + tick * 7 + row * 31)
-    line = list(" " * width)
+    rng = _LEAF_RNG
+    rng.seed(seed + tick * 7 + row * 31)
+    leaves = {}
     num_leaves = rng.randint(1, 3)
     for _ in range(num_leaves):
         col = (rng.randint(0, width - 2) + tick * 2 + row) % (width - 1)
-        char = rng.choice(LEAF_CHARS)
-        line[col] = char
+        leaves[col] = rng.choice(LEAF_CHARS)
+
+    # Stitch the few leaves together with runs of spaces
+    line = []
+    last = 0
+    for col in sorted(leaves):
+        line.append(" " * (col - last))
+        line.append(leaves[col])
+        last = col + 1
+    line.append(" " * (width - last))
     return "".join(line)
 
 
+# Raw terminal escapes for the startup banner, which is drawn without Rich
+_ANSI_RESET = "\x1b[0m"
+_ANSI_CLEAR_EOL = "\x1b[K"
+_ANSI_HIDE_CURSOR = "\x1b[?25l"
+_ANSI_SHOW_CURSOR = "\x1b[?25h"
+
+
+def _ansi(color: str, bold: bool = False, dim: bool = False) -> str:
+    """Escape sequence for a '#rrggbb' truecolor foreground."""
+    r, g, b = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+    attrs = ("1;" if bold else "") + ("2;" if dim else "")
+    return f"\x1b[{attrs}38;2;{r};{g};{b}m"
+
+
 def _build_frame(tick: int) -> str:
-    """Build one full animation frame as a Rich-markup string."""
+    """Build one full animation frame as a string with ANSI color escapes."""
     lines = []
 
     # Falling leaves above the banner
+    leaf = _ansi(COLORS['leaf'])
     for row in range(LEAF_FIELD_ROWS):
         leaf_line = _generate_leaf_line(tick, row, WAVE_WIDTH, seed=42)
-        lines.append(f"[{COLORS['leaf']}]{leaf_line}[/{COLORS['leaf']}]")
+        lines.append(f"{leaf}{leaf_line}{_ANSI_RESET}")
 
     # Static banner
+    primary = _ansi(COLORS['primary'], bold=True)
     for art_line in BANNER_ART:
-        lines.append(f"[bold {COLORS['primary']}]{art_line}[/bold {COLORS['primary']}]")
+        lines.append(f"{primary}{art_line}{_ANSI_RESET}")
 
     # Ocean waves beneath the banner
+    ocean = _ansi(COLORS['ocean'])
     for row in range(WAVE_ROWS):
         wave_line = _generate_wave_line(tick, row, WAVE_WIDTH)
-        lines.append(f"[{COLORS['ocean']}]{wave_line}[/{COLORS['ocean']}]")
+        lines.append(f"{ocean}{wave_line}{_ANSI_RESET}")
 
     # Subtitle block (static)
     lines.append("")
-    lines.append(f"[bold {COLORS['leaf']}]🌊  Process Efficiency Monitor  🌿[/bold {COLORS['leaf']}]")
-    lines.append(f"[dim {COLORS['secondary']}]by Serene Interactive, Global[/dim {COLORS['secondary']}]")
+    lines.append(f"{_ansi(COLORS['leaf'], bold=True)}🌊  Process Efficiency Monitor  🌿{_ANSI_RESET}")
+    lines.append(f"{_ansi(COLORS['secondary'], dim=True)}by Serene Interactive, Global{_ANSI_RESET}")
     lines.append("")
-    lines.append(f"[dim {COLORS['ocean']}]Type /help for commands[/dim {COLORS['ocean']}]")
+    lines.append(f"{_ansi(COLORS['ocean'], dim=True)}Type /help for commands{_ANSI_RESET}")
+
+    return "\n".join(lines)
 
-    centered = "\n".join(lines)
-    return centered
+
+def _animate_banner(n_lines: int) -> bool:
+    """Whether the n_lines-tall startup banner should play its animation"""
+    if os.environ.get("SEAGREEN_NO_ANIM") or os.environ.get("NO_COLOR"):
+        return False
+    if not console.is_terminal or not sys.stdout.isatty():
+        return False
+    # Raw truecolor escapes skip Rich's color downgrade and legacy Windows support
+    if console.color_system != "truecolor" or console.legacy_windows:
+        return False
+    # Redrawing in place needs the whole block on screen
+    return console.width >= WAVE_WIDTH and console.height > n_lines
 
 
 def print_banner():
@@ -116,60 +167,140 @@ def print_banner():
     total_frames = int(ANIM_DURATION * ANIM_FPS)
     frame_delay = 1.0 / ANIM_FPS
 
+    final_frame = _build_frame(total_frames)
+    n_lines = final_frame.count("\n") + 1
+
     console.print()
+
+    # Rich prints a single static frame when animating isn't wanted or can't be
+    # redrawn in place; it also strips or downgrades the colors as appropriate
+    if not _animate_banner(n_lines):
+        from rich.align import Align
+
+        console.print(Align.center(Text.from_ansi(final_frame)))
+        console.print()
+        return
+
+    # The animation is deterministic, so build every frame up front; each line
+    # is padded to center the block and cleared to end-of-line so a redraw
+    # never leaves stale characters behind
+    pad = " " * ((console.width - WAVE_WIDTH) // 2)
+    frames = [
+        "".join(f"{pad}{line}{_ANSI_CLEAR_EOL}\n" for line in _build_frame(tick).split("\n"))
+        for tick in range(total_frames + 1)
+    ]
+    cursor_up = f"\x1b[{n_lines}A"
+
+    out = sys.stdout
+    redraw = ""  # Cursor-up prefix, set once the first frame is on screen
     try:
-        with Live(
-            Align.center(Text.from_markup(_build_frame(0))),
-            console=console,
-            refresh_per_second=ANIM_FPS,
-            transient=True,
-        ) as live:
-            for tick in range(total_frames):
-                live.update(Align.center(Text.from_markup(_build_frame(tick))))
-                time.sleep(frame_delay)
+        out.write(_ANSI_HIDE_CURSOR + frames[0])
+        out.flush()
+        redraw = cursor_up
+        for tick in range(1, total_frames + 1):
+            time.sleep(frame_delay)
+            out.write(cursor_up + frames[tick])
+            out.flush()
     except KeyboardInterrupt:
-        pass
+        # Leave the final frame on screen
+        out.write(redraw + frames[total_frames])
+    finally:
+        out.write(_ANSI_SHOW_CURSOR + "\n")
+        out.flush()
+
+
+def _linux_python_pids() -> List[int]:
+    """PIDs whose /proc/<pid>/comm mentions python (Linux only)"""
+    pids = []
+    with os.scandir('/proc') as entries:
+        for entry in entries:
+            if not entry.name.isdigit():
+                continue
+            try:
+                # comm is a single short read, far cheaper than a full psutil lookup
+                with open(f'/proc/{entry.name}/comm') as f:
+                    comm = f.read()
+            except OSError:
+                continue
+            if 'python' in comm.lower():
+                pids.append(int(entry.name))
+    return pids
+
+
+def _iter_python_processes():
+    """Yield (pid, name, cmdline) for each running Python process"""
+    if sys.platform.startswith('linux'):
+        for pid in _linux_python_pids():
+            try:
+                proc = psutil.Process(pid)
+                with proc.oneshot():
+                    name = proc.name()
+                    try:
+                        cmdline = proc.cmdline()
+                    except (psutil.AccessDenied, psutil.ZombieProcess):
+                        cmdline = None
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                continue
+            yield pid, name, cmdline
+        return
+
+    # Only fetch name up front; the cmdline is read just for the Python hits
+    for proc in psutil.process_iter(['pid', 'name']):
+        name = proc.info['name'] or ''
+        if 'python' not in name.lower():
+            continue
+        try:
+            cmdline = proc.cmdline()
+        except (psutil.AccessDenied, psutil.ZombieProcess):
+            cmdline = None
+        except psutil.NoSuchProcess:
+            continue
+        yield proc.info['pid'], name, cmdline
 
-    # Print the final static frame so it stays on screen
-    console.print(Align.center(Text.from_markup(_build_frame(total_frames))))
-    console.print()
+
+# /list table layout as (header, style, width); the style strings are built
+# once here so every listing hands Rich the same objects
+_LIST_HEADER_STYLE = f"bold {COLORS['dark']}"
+_LIST_COLUMNS = (
+    ("PID", f"bold {COLORS['primary']}", 8),
+    ("Process", COLORS['dark'], 12),
+    ("Command", COLORS['secondary'], None),
+)
+
+
+def _make_list_table() -> Table:
+    """Empty /list table built from the cached column layout"""
+    table = Table(
+        show_header=True,
+        header_style=_LIST_HEADER_STYLE,
+        border_style=COLORS['accent'],
+        box=box.SIMPLE
+    )
+    for header, style, width in _LIST_COLUMNS:
+        table.add_column(header, style=style, width=width)
+    return table
 
 
 def list_python_processes():
     """Show all Python processes the user might want to track"""
     python_procs = []
     
-    for proc in psutil.process_iter(['pid', 'name', 'cmdline', 'cpu_percent', 'memory_info']):
-        try:
-            # Check if it's a Python process
-            if 'python' in proc.info['name'].lower():
-                cmd = ' '.join(proc.info['cmdline']) if proc.info['cmdline'] else '[unknown]'
-                # Skip Seagreen itself
-                if 'seagreen' in cmd.lower():
-                    continue
-                python_procs.append({
-                    'pid': proc.info['pid'],
-                    'name': proc.info['name'],
-                    'cmd': cmd[:60] + '...' if len(cmd) > 60 else cmd,
-                    'cpu': proc.info['cpu_percent'] or 0,
-                })
-        except (psutil.NoSuchProcess, psutil.AccessDenied):
+    for pid, name, cmdline in _iter_python_processes():
+        cmd = ' '.join(cmdline) if cmdline else '[unknown]'
+        # Skip Seagreen itself
+        if 'seagreen' in cmd.lower():
             continue
+        python_procs.append({
+            'pid': pid,
+            'name': name,
+            'cmd': cmd[:60] + '...' if len(cmd) > 60 else cmd,
+        })
     
     if not python_procs:
         console.print(f"[bold {COLORS['secondary']}]No Python processes found. Start a Python script first![/bold {COLORS['secondary']}]")
         return
     
-    table = Table(
-        show_header=True,
-        header_style=f"bold {COLORS['dark']}",
-        border_style=COLORS['accent'],
-        box=box.SIMPLE
-    )
-    table.add_column("PID", style=f"bold {COLORS['primary']}", width=8)
-    table.add_column("Process", style=COLORS['dark'], width=12)
-    table.add_column("Command", style=COLORS['secondary'])
-    
+    table = _make_list_table()
     for proc in python_procs[:20]:  # Show max 20
         table.add_row(
             str(proc['pid']),
@@ -181,6 +312,42 @@ def list_python_processes():
     console.print(f"\n[dim]Use: /track <pid> to monitor one[/dim]\n")
 
 
+class _SnapshotThread(threading.Thread):
+    """Takes tracker snapshots on a fixed cadence, independent of the UI"""
+
+    def __init__(self, tracker: SeagreenTracker, interval: float):
+        super().__init__(daemon=True)
+        self.tracker = tracker
+        self.interval = interval
+        self.error: Optional[Exception] = None
+        self._stop_event = threading.Event()
+
+    def run(self):
+        # Schedule against absolute deadlines so snapshot cost doesn't add drift.
+        # The first snapshot waits a full interval so its CPU reading covers a
+        # real window since start_monitoring() primed the counter.
+        next_tick = time.monotonic() + self.interval
+        while not self._stop_event.wait(max(0.0, next_tick - time.monotonic())):
+            try:
+                self.tracker.take_snapshot()
+            except Exception as e:
+                self.error = e
+                return
+            next_tick += self.interval
+            # After a stall (suspended app, slow /proc read) resync rather than
+            # firing back-to-back snapshots over near-empty CPU windows
+            now = time.monotonic()
+            if next_tick <= now:
+                next_tick = now + self.interval
+
+    def stop(self):
+        """Stop sampling and wait for the thread to finish"""
+        self._stop_event.set()
+        # No timeout: the loop exits right after any in-flight snapshot, and
+        # the report must not read the buffers while one is still being written
+        self.join()
+
+
 def track_process(pid: int, duration: float = 10.0):
     """Monitor a specific process"""
     try:
@@ -195,19 +362,46 @@ def track_process(pid: int, duration: float = 10.0):
     console.print(f"\n[bold {COLORS['primary']}]Monitoring PID {pid} for {duration}s...[/bold {COLORS['primary']}]")
     console.print(f"[dim]Press Ctrl+C to stop early[/dim]\n")
     
+    # Room for every sample up front; sessions past an hour grow as needed
+    reserve_for = min(duration, 3600) if math.isfinite(duration) else 3600
+    tracker.reserve(int(reserve_for / SAMPLE_INTERVAL) + 2)
     tracker.start_monitoring()
+    sampler = _SnapshotThread(tracker, SAMPLE_INTERVAL)
+    sampler.start()
     
-    # Simple progress display
-    start_time = time.time()
+    # Simple progress display; sampling runs on its own thread
+    # Styled Text skips Rich's markup parser on every status refresh
+    status_style = f"bold {COLORS['ocean']}"
+    # One monotonic clock read per tick, immune to wall-clock adjustments
+    start_time = time.monotonic()
+    deadline = start_time + duration
     try:
-        with console.status(f"[bold {COLORS['ocean']}]Tracking...", spinner="dots") as status:
-            while time.time() - start_time < duration:
-                tracker.take_snapshot()
-                elapsed = time.time() - start_time
-                status.update(f"[bold {COLORS['ocean']}]{elapsed:.1f}s / {duration}s elapsed...")
-                time.sleep(0.5)
+        with console.status(Text("Tracking...", style=status_style), spinner="dots") as status:
+            while sampler.is_alive():
+                now = time.monotonic()
+                if now >= deadline:
+                    break
+                elapsed = now - start_time
+                status.update(Text(f"{elapsed:.1f}s / {duration}s elapsed...", style=status_style))
+                time.sleep(1 / ANIM_FPS)
     except KeyboardInterrupt:
         console.print(f"\n[bold {COLORS['secondary']}]Stopped early.[/bold {COLORS['secondary']}]")
+    finally:
+        sampler.stop()
+    
+    # Sessions shorter than one interval (or stopped that early) end before the
+    # sampler's first tick; the counter was primed at start, so this closing
+    # read still covers a real window
+    if not tracker.has_samples and sampler.error is None:
+        try:
+            tracker.take_snapshot()
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            pass
+    
+    if isinstance(sampler.error, (psutil.NoSuchProcess, psutil.AccessDenied)):
+        console.print(f"\n[bold {COLORS['secondary']}]Process {pid} is no longer accessible, stopping early.[/bold {COLORS['secondary']}]")
+    elif sampler.error is not None:
+        console.print(f"\n[bold red]Sampling stopped early: {sampler.error}[/bold red]")
     
     # Generate report
     try:
@@ -263,13 +457,68 @@ def print_help():
     console.print(help_text)
 
 
+# Returned by a command handler to leave the REPL
+_EXIT = object()
+
+
+def _do_help(args: List[str]):
+    """Handle /help"""
+    print_help()
+
+
+def _do_list(args: List[str]):
+    """Handle /list"""
+    list_python_processes()
+
+
+def _do_track(args: List[str]):
+    """Handle /track <pid> [seconds]"""
+    if len(args) < 1:
+        console.print(f"[bold red]Usage: /track <pid> [seconds][/bold red]")
+        return
+    
+    try:
+        pid = int(args[0])
+    except ValueError:
+        console.print(f"[bold red]PID must be a number. Example: /track 1234[/bold red]")
+        return
+    
+    try:
+        duration = float(args[1]) if len(args) > 1 else 10.0
+    except ValueError:
+        duration = math.nan
+    # Also rejects nan, which float() accepts; inf tracks until Ctrl+C
+    if not duration > 0:
+        console.print(f"[bold red]Duration must be a positive number of seconds. Example: /track 1234 30[/bold red]")
+        return
+    
+    track_process(pid, duration)
+
+
+def _do_quit(args: List[str]):
+    """Handle /quit and its aliases"""
+    console.print(_GOODBYE)
+    return _EXIT
+
+
+_CMDS = {
+    '/help': _do_help,
+    '/list': _do_list,
+    '/track': _do_track,
+    '/quit': _do_quit,
+    '/exit': _do_quit,
+    'quit': _do_quit,
+    'exit': _do_quit,
+}
+
+
 def main():
     print_banner()
     
     while True:
         try:
             # Get user input
-            user_input = console.input(f"[bold {COLORS['primary']}]🌊 > [/bold {COLORS['primary']}]").strip()
+            user_input = console.input(_PROMPT).strip()
             
             if not user_input:
                 continue
@@ -279,33 +528,16 @@ def main():
             command = parts[0].lower()
             args = parts[1:]
             
-            if command in ['/quit', '/exit', 'quit', 'exit']:
-                console.print(f"[bold {COLORS['leaf']}]Goodbye! 🌊[/bold {COLORS['leaf']}]")
-                break
-                
-            elif command == '/help':
-                print_help()
-                
-            elif command == '/list':
-                list_python_processes()
-                
-            elif command == '/track':
-                if len(args) < 1:
-                    console.print(f"[bold red]Usage: /track <pid> [seconds][/bold red]")
-                    continue
-                
-                try:
-                    pid = int(args[0])
-                    duration = float(args[1]) if len(args) > 1 else 10.0
-                    track_process(pid, duration)
-                except ValueError:
-                    console.print(f"[bold red]PID must be a number. Example: /track 1234[/bold red]")
-                    
-            else:
+            handler = _CMDS.get(command)
+            if handler is None:
                 console.print(f"[bold red]Unknown command: {command}. Type /help for commands.[/bold red]")
+                continue
+            if handler(args) is _EXIT:
+                break
                 
         except KeyboardInterrupt:
-            console.print(f"\n[bold {COLORS['leaf']}]Goodbye! 🌊[/bold {COLORS['leaf']}]")
+            console.print()
+            console.print(_GOODBYE)
             break
         except EOFError:
             break
@@ -5,13 +5,16 @@ Measures computational efficiency with eco-friendly metrics
 
 import psutil
 import time
+from array import array
 from dataclasses import dataclass
-from typing import Optional
+from typing import List, Optional
 
 
 @dataclass
 class ResourceSnapshot:
     """A single snapshot of resource usage"""
+    __slots__ = ('timestamp', 'cpu_percent', 'memory_mb', 'memory_percent')
+
     timestamp: float
     cpu_percent: float
     memory_mb: float
@@ -50,17 +53,53 @@ class SeagreenTracker:
     def __init__(self, pid: int):
         self.pid = pid
         self.process = psutil.Process(pid)
-        self.snapshots: list[ResourceSnapshot] = []
+        # Captured now so a report can still be built if the process exits
+        self.process_name = self.process.name()
+        # Snapshot columns, stored as flat C doubles rather than one object per tick
+        self._timestamps = array('d')
+        self._cpu = array('d')
+        self._mem_mb = array('d')
+        self._mem_percent = array('d')
+        self._n = 0  # Snapshots stored; the columns may be reserved beyond this
         self.start_time: Optional[float] = None
         
+    def reserve(self, n: int):
+        """Preallocate room for n snapshots so sampling doesn't grow the buffers"""
+        extra = n - len(self._cpu)
+        if extra > 0:
+            padding = array('d', [0.0]) * extra
+            for column in self._columns():
+                column.extend(padding)
+
+    def _columns(self):
+        return (self._timestamps, self._cpu, self._mem_mb, self._mem_percent)
+
     def start_monitoring(self):
         """Begin tracking the process"""
-        self.start_time = time.time()
+        # Prime the CPU counter; the first snapshot should come a full sample
+        # interval later so its non-blocking read measures a real window
+        self.process.cpu_percent(interval=None)
+        # Monotonic so the reported duration survives system clock changes
+        self.start_time = time.monotonic()
+
+    @property
+    def has_samples(self) -> bool:
+        """Whether at least one snapshot has been taken"""
+        return self._n > 0
+
+    @property
+    def snapshots(self) -> List[ResourceSnapshot]:
+        """All snapshots taken so far"""
+        n = self._n
+        return [
+            ResourceSnapshot(*row)
+            for row in zip(*(column[:n] for column in self._columns()))
+        ]
         
     def take_snapshot(self) -> ResourceSnapshot:
         """Capture current resource usage"""
         with self.process.oneshot():
-            cpu = self.process.cpu_percent(interval=0.1)
+            cpu = self.process.cpu_percent(interval=None)
             mem_info = self.process.memory_info()
             mem_mb = mem_info.rss / 1024 / 1024  # Convert to MB
             mem_percent = self.process.memory_percent()
@@ -71,23 +110,32 @@ class SeagreenTracker:
             memory_mb=mem_mb,
             memory_percent=mem_percent
         )
-        self.snapshots.append(snapshot)
+        row = (snapshot.timestamp, cpu, mem_mb, mem_percent)
+        i = self._n
+        if i < len(self._cpu):
+            for column, value in zip(self._columns(), row):
+                column[i] = value
+        else:
+            for column, value in zip(self._columns(), row):
+                column.append(value)
+        self._n = i + 1
         return snapshot
     
     def generate_report(self) -> SeagreenReport:
         """Generate the final efficiency report"""
-        if not self.snapshots or self.start_time is None:
+        if not self._n or self.start_time is None:
             raise ValueError("No monitoring data collected!")
             
-        duration = time.time() - self.start_time
-        
-        # Calculate averages and peaks
-        cpu_values = [s.cpu_percent for s in self.snapshots]
-        mem_values = [s.memory_mb for s in self.snapshots]
+        duration = time.monotonic() - self.start_time
         
-        avg_cpu = sum(cpu_values) / len(cpu_values)
+        # Calculate averages and peaks straight off the column buffers;
+        # sum/max over array('d') run in C, with no per-item attribute lookups
+        n = self._n
+        cpu_values = self._cpu[:n]
+        mem_values = self._mem_mb[:n]
+        avg_cpu = sum(cpu_values) / n
         peak_cpu = max(cpu_values)
-        avg_memory = sum(mem_values) / len(mem_values)
+        avg_memory = sum(mem_values) / n
         peak_memory = max(mem_values)
         
         # CPU-seconds: how much CPU time was actually consumed
@@ -114,7 +162,7 @@ class SeagreenTracker:
             rating = "🍂 Needs Improvement"
             
         return SeagreenReport(
-            process_name=self.process.name(),
+            process_name=self.process_name,
             duration_seconds=duration,
             avg_cpu=avg_cpu,
             peak_cpu=peak_cpu,